@@ -0,0 +1,67 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from fastapi import Request, Response, status
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResponseCache:
+    """In-process LRU cache of serialized GET responses.
+
+    Entries expire after `ttl_seconds`, and at most `max_entries` are kept.
+    `invalidate()` clears the cache and bumps `generation`; `set()` only
+    stores a body if `generation` has not changed since the caller read it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[float, str, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, etag, body = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return etag, body
+
+    def set(self, key: str, body: bytes, generation: int) -> tuple[str, bytes]:
+        """Store `body` unless the cache was invalidated since `generation`."""
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        if generation != self.generation:
+            return etag, body
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return etag, body
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
+def etag_response(request: Request, etag: str, body: bytes) -> Response:
+    """Return `body` as JSON, or a 304 if the client already holds `etag`."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+product_cache = ResponseCache()
@@ -0,0 +1,36 @@
+"""Create the database tables and bring existing databases up to date.
+
+Run once per deployment with `python -m product.init_db`, or set
+`CREATE_TABLES=1` to have the app create them on startup in development.
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from . import models
+from .database import engine
+
+# create_all never alters existing tables, so indexes added to the models
+# after a database was created are applied here. Fresh databases already get
+# them from create_all under the same names.
+SCHEMA_UPGRADES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_sellers_username ON sellers (username)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_sellers_email ON sellers (email)",
+)
+
+
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+
+
+async def main():
+    await create_tables()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
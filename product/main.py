@@ -1,10 +1,26 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from . import models
 from .database import engine
+from .init_db import create_tables
+from .querylog import enable_query_logging
 from .routers import login, product, seller
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.getenv("CREATE_TABLES") == "1":
+        await create_tables()
+    yield
+    await engine.dispose()
+
+
 app = FastAPI(
     title="Product Management API",
     description="API for managing products and sellers",
@@ -34,19 +50,32 @@ app = FastAPI(
         {"url": "http://localhost:8000", "description": "Local development server"},
         {"url": "https://api.example.com", "description": "Production server"},
     ],
+    lifespan=lifespan,
 )
 
-# Enable CORS for development (adjust origins for production)
+# Explicit origins: browsers reject credentialed responses to a "*" origin.
+# Override with a comma-separated CORS_ORIGINS list per environment.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS", "http://localhost:3000,https://app.example.com"
+    ).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
+# Development aid: log per-request query counts and warn on likely N+1 queries
+if os.getenv("DB_QUERY_LOG_DETECT_N1", "").lower() == "true":
+    enable_query_logging(app, engine)
+
 app.include_router(product.router)
 app.include_router(seller.router)
 app.include_router(login.router)
-
-models.Base.metadata.create_all(engine)
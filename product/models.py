@@ -18,7 +18,7 @@ class Product(Base):
 class Seller(Base):
     __tablename__ = "sellers"
     id = Column(Integer, primary_key=True, index=True)
-    username = Column(String)
-    email = Column(String)
-    password = Column(String)
+    username = Column(String, unique=True, index=True, nullable=False)
+    email = Column(String, unique=True, index=True, nullable=False)
+    password = Column(String(60), nullable=False)
     products = relationship("Product", back_populates="seller")
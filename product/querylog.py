@@ -0,0 +1,64 @@
+import logging
+from contextvars import ContextVar
+
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_THRESHOLD = 10
+
+_query_counter: ContextVar[list[int] | None] = ContextVar("query_counter", default=None)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class QueryCountMiddleware:
+    """Warn when a single request issues more SQL statements than expected.
+
+    A lazy-loaded relationship touched in a loop shows up as a request whose
+    statement count grows with the number of rows, which is the signature of
+    an N+1 query.
+    """
+
+    def __init__(self, app, threshold: int = DEFAULT_QUERY_THRESHOLD):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # A mutable holder, so counts made in SQLAlchemy's greenlets and in
+        # child tasks land on the same object.
+        counter = [0]
+        token = _query_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_counter.reset(token)
+            logger.debug(
+                "%s %s issued %d queries", scope["method"], scope["path"], counter[0]
+            )
+            if counter[0] > self.threshold:
+                logger.warning(
+                    "%s %s issued %d queries (threshold %d); possible N+1",
+                    scope["method"],
+                    scope["path"],
+                    counter[0],
+                    self.threshold,
+                )
+
+
+def enable_query_logging(
+    app: FastAPI, engine: AsyncEngine, threshold: int = DEFAULT_QUERY_THRESHOLD
+):
+    """Count SQL statements per request and flag likely N+1 patterns."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+    app.add_middleware(QueryCountMiddleware, threshold=threshold)
@@ -1,30 +1,82 @@
-from typing import List
+import logging
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Body, HTTPException, Query, Request, status
 from fastapi.params import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from .. import models, schemas
+from ..cache import etag_response, product_cache
 from ..database import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["Products"], prefix="/api/v1/products")
 
+MAX_BULK_PRODUCTS = 1000
+
 
 @router.get(
     "/",
-    response_model=List[schemas.DisplayProduct],
-    summary="List all products",
-    description="Retrieve a list of all products. Supports pagination and filtering in future iterations.",
-    response_description="A JSON array of product objects",
+    response_model=schemas.ProductPage,
+    summary="List products",
+    description="Retrieve a page of products ordered by ID. Pass the returned `next_cursor` as `cursor` to fetch the next page.",
+    response_description="A page of product objects and the cursor for the next page",
     operation_id="listProducts",
 )
-def products(db: Session = Depends(get_db)):
-    """Return all products from the database.
+async def products(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Return one page of products from the database.
+
+    Pages are keyed on the product ID: `cursor` is the last ID of the previous
+    page and `next_cursor` is null on the last page. Each product is
+    represented using the `DisplayProduct` schema (passwords or sensitive
+    info are never returned).
 
-    Returns a list of products. Each product is represented using the
-    `DisplayProduct` schema (passwords or sensitive info are never returned).
+    Only the columns the schema needs are selected, joined to the seller in
+    a single query.
     """
-    return db.query(models.Product).all()
+    key = f"products:limit={limit}:cursor={cursor}"
+    cached = product_cache.get(key)
+    if cached is not None:
+        return etag_response(request, *cached)
+    generation = product_cache.generation
+
+    query = (
+        select(
+            models.Product.id,
+            models.Product.name,
+            models.Product.description,
+            models.Seller.username,
+            models.Seller.email,
+        )
+        .join(models.Product.seller)
+        .order_by(models.Product.id)
+        .limit(limit)
+    )
+    if cursor is not None:
+        query = query.where(models.Product.id > cursor)
+
+    rows = (await db.execute(query)).all()
+    page = schemas.ProductPage(
+        items=[
+            schemas.DisplayProduct(
+                name=row.name,
+                description=row.description,
+                seller=schemas.DisplaySeller(username=row.username, email=row.email),
+            )
+            for row in rows
+        ],
+        next_cursor=rows[-1].id if len(rows) == limit else None,
+    )
+    body = page.model_dump_json().encode()
+    return etag_response(request, *product_cache.set(key, body, generation))
 
 
 @router.get(
@@ -38,11 +90,20 @@ def products(db: Session = Depends(get_db)):
     },
     operation_id="getProductById",
 )
-def get_product(id: int, db: Session = Depends(get_db)):
-    product = db.query(models.Product).filter(models.Product.id == id).first()
-    if product:
-        return product
-    raise HTTPException(status_code=404, detail="Product not found")
+async def get_product(id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    key = f"product:{id}"
+    cached = product_cache.get(key)
+    if cached is not None:
+        return etag_response(request, *cached)
+    generation = product_cache.generation
+
+    product = await db.get(
+        models.Product, id, options=[joinedload(models.Product.seller)]
+    )
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    body = schemas.DisplayProduct.model_validate(product).model_dump_json().encode()
+    return etag_response(request, *product_cache.set(key, body, generation))
 
 
 @router.delete(
@@ -62,13 +123,13 @@ def get_product(id: int, db: Session = Depends(get_db)):
     },
     operation_id="deleteProduct",
 )
-def delete_product(id: int, db: Session = Depends(get_db)):
-    product = db.query(models.Product).filter(models.Product.id == id).first()
-    if product:
-        db.delete(product)
-        db.commit()
-        return {"message": "Product deleted successfully"}
-    raise HTTPException(status_code=404, detail="Product not found")
+async def delete_product(id: int, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(delete(models.Product).where(models.Product.id == id))
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    await db.commit()
+    product_cache.invalidate()
+    return {"message": "Product deleted successfully"}
 
 
 @router.put(
@@ -83,18 +144,20 @@ def delete_product(id: int, db: Session = Depends(get_db)):
     },
     operation_id="updateProduct",
 )
-def update_product(
-    id: int, request: schemas.ProductUpdate, db: Session = Depends(get_db)
+async def update_product(
+    id: int, request: schemas.ProductUpdate, db: AsyncSession = Depends(get_db)
 ):
-    product = db.query(models.Product).filter(models.Product.id == id).first()
+    product = await db.get(
+        models.Product, id, options=[joinedload(models.Product.seller)]
+    )
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
     update_data = request.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(product, key, value)
-    db.commit()
-    db.refresh(product)
+    await db.commit()
+    product_cache.invalidate()
     return product
 
 
@@ -125,7 +188,7 @@ def update_product(
     },
     operation_id="createProduct",
 )
-def add(request: schemas.Product, db: Session = Depends(get_db)):
+async def add(request: schemas.Product, db: AsyncSession = Depends(get_db)):
     new_product = models.Product(
         name=request.name,
         description=request.description,
@@ -133,11 +196,56 @@ def add(request: schemas.Product, db: Session = Depends(get_db)):
         seller_id=1,
     )
 
-    print(
-        f"Adding product: {new_product.name}, Price: {new_product.price}, Description: {new_product.description}"
+    logger.debug(
+        "Adding product: %s, Price: %s, Description: %s",
+        new_product.name,
+        new_product.price,
+        new_product.description,
     )
 
     db.add(new_product)
-    db.commit()
-    db.refresh(new_product)
+    await db.commit()
+    product_cache.invalidate()
     return {"message": "Product added successfully", "product": new_product}
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Create products in bulk",
+    description=f"Create up to {MAX_BULK_PRODUCTS} products in a single INSERT. The returned ids are in the same order as the request list. Like the single-product endpoint, seller_id=1 is assigned by default.",
+    responses={
+        201: {
+            "description": "Products created successfully",
+            "content": {
+                "application/json": {
+                    "example": {"message": "Products added successfully", "ids": [1, 2]}
+                }
+            },
+        },
+        400: {"description": "Bad request"},
+        422: {
+            "description": f"Validation error or more than {MAX_BULK_PRODUCTS} products"
+        },
+    },
+    operation_id="createProductsBulk",
+)
+async def add_bulk(
+    request: List[schemas.Product] = Body(..., max_length=MAX_BULK_PRODUCTS),
+    db: AsyncSession = Depends(get_db),
+):
+    if not request:
+        raise HTTPException(status_code=400, detail="No products provided")
+
+    result = await db.execute(
+        insert(models.Product).returning(models.Product.id),
+        [{**product.model_dump(), "seller_id": 1} for product in request],
+    )
+    # RETURNING row order is unspecified, but SQLite hands out the integer
+    # primary key in ascending VALUES order within the write transaction, so
+    # sorting maps ids back to request positions. sort_by_parameter_order
+    # would need an insert sentinel here and fall back to one INSERT per row.
+    ids = sorted(result.scalars().all())
+    await db.commit()
+    product_cache.invalidate()
+    return {"message": "Products added successfully", "ids": ids}
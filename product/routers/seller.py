@@ -1,13 +1,11 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, status
 from fastapi.params import Depends
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas
 from ..database import get_db
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
+from ..security import hash_password
 
 router = APIRouter(prefix="/api/v1", tags=["Sellers"])
 
@@ -20,17 +18,23 @@ router = APIRouter(prefix="/api/v1", tags=["Sellers"])
     description="Register a new seller. Passwords are hashed before storage; the returned seller does not include the password field.",
     responses={
         201: {"description": "Seller created successfully"},
-        400: {"description": "Invalid input"},
+        400: {"description": "Invalid input or username/email already taken"},
     },
     operation_id="createSeller",
 )
-def create_seller(request: schemas.Seller, db: Session = Depends(get_db)):
-    hashed_password = pwd_context.hash(request.password)
+async def create_seller(request: schemas.Seller, db: AsyncSession = Depends(get_db)):
+    hashed_password = await hash_password(request.password)
     new_seller = models.Seller(
         username=request.username, email=request.email, password=hashed_password
     )
 
     db.add(new_seller)
-    db.commit()
-    db.refresh(new_seller)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered",
+        )
     return new_seller
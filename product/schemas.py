@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Product(BaseModel):
@@ -19,8 +19,7 @@ class DisplaySeller(BaseModel):
     username: str
     email: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DisplayProduct(BaseModel):
@@ -28,8 +27,12 @@ class DisplayProduct(BaseModel):
     description: str
     seller: DisplaySeller
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProductPage(BaseModel):
+    items: List[DisplayProduct]
+    next_cursor: Optional[int] = None
 
 
 class Seller(BaseModel):
@@ -0,0 +1,33 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+# Each round doubles the cost of a hash. Lower BCRYPT_ROUNDS (minimum 4) only
+# in development and test environments; production should keep the default.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+)
+
+# bcrypt releases the GIL while hashing, so a bounded thread pool is enough to
+# keep the event loop free without paying process start-up and pickling costs.
+hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="bcrypt"
+)
+
+
+async def run_in_hash_executor(func, *args):
+    """Run a CPU-heavy password hashing call off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_executor, func, *args)
+
+
+async def hash_password(password: str) -> str:
+    return await run_in_hash_executor(pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    return await run_in_hash_executor(pwd_context.verify, password, hashed_password)
@@ -0,0 +1,55 @@
+import os
+
+# Cheap hashes for tests; read when product.security is imported below.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from product import models  # noqa: E402
+from product.cache import product_cache  # noqa: E402
+from product.database import get_db  # noqa: E402
+from product.main import app  # noqa: E402
+
+
+@pytest.fixture
+def statements():
+    """SQL statements issued through the test database, in order."""
+    return []
+
+
+@pytest.fixture
+def client(tmp_path, statements):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    sync_engine = create_engine(url)
+    models.Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    engine = create_async_engine(
+        url.replace("sqlite://", "sqlite+aiosqlite://"), poolclass=NullPool
+    )
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    SessionLocal = async_sessionmaker(
+        bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+    async def get_test_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_test_db
+    product_cache.invalidate()
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
@@ -0,0 +1,56 @@
+from starlette.requests import Request
+
+from product.cache import ResponseCache, etag_response
+
+
+def make_request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_invalidate_clears_entries():
+    cache = ResponseCache()
+    cache.set("product:1", b'{"name": "old"}', cache.generation)
+
+    cache.invalidate()
+
+    assert cache.get("product:1") is None
+
+
+def test_set_skipped_when_invalidated_during_read():
+    cache = ResponseCache()
+    generation = cache.generation
+
+    # A write commits and invalidates while the reader awaits the database.
+    cache.invalidate()
+    cache.set("products:limit=50:cursor=None", b'{"items": []}', generation)
+
+    assert cache.get("products:limit=50:cursor=None") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1", cache.generation)
+    cache.set("b", b"2", cache.generation)
+    cache.get("a")
+
+    cache.set("c", b"3", cache.generation)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_etag_response_returns_304_for_matching_etag():
+    etag, body = ResponseCache().set("product:1", b'{"name": "n"}', 0)
+
+    fresh = etag_response(make_request(), etag, body)
+    revalidated = etag_response(make_request(etag), etag, body)
+    stale = etag_response(make_request('"other"'), etag, body)
+
+    assert fresh.status_code == 200 and fresh.body == body
+    assert fresh.headers["etag"] == etag
+    assert revalidated.status_code == 304 and revalidated.body == b""
+    assert stale.status_code == 200
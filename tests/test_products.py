@@ -0,0 +1,29 @@
+def test_bulk_insert_uses_one_statement_and_keeps_request_order(client, statements):
+    # Bulk products are assigned to seller 1.
+    seller = {"username": "seller", "email": "seller@test.com", "password": "pw"}
+    assert client.post("/api/v1/seller", json=seller).status_code == 201
+    statements.clear()
+    products = [
+        {"name": f"product {i}", "price": i, "description": f"description {i}"}
+        for i in range(50)
+    ]
+
+    response = client.post("/api/v1/products/bulk", json=products)
+
+    assert response.status_code == 201
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+
+    ids = response.json()["ids"]
+    assert len(ids) == len(products)
+    for product_id, product in zip(ids, products):
+        shown = client.get(f"/api/v1/products/{product_id}")
+        assert shown.json()["name"] == product["name"]
+
+
+def test_bulk_insert_rejects_oversized_payload(client):
+    product = {"name": "n", "price": 1, "description": "d"}
+
+    response = client.post("/api/v1/products/bulk", json=[product] * 1001)
+
+    assert response.status_code == 422
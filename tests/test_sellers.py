@@ -0,0 +1,27 @@
+import pytest
+
+SELLER = {"username": "seller", "email": "seller@test.com", "password": "pw"}
+
+
+def test_create_seller(client):
+    response = client.post("/api/v1/seller", json=SELLER)
+
+    assert response.status_code == 201
+    assert response.json() == {"username": "seller", "email": "seller@test.com"}
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [
+        {**SELLER, "email": "other@test.com"},
+        {**SELLER, "username": "other"},
+    ],
+    ids=["username", "email"],
+)
+def test_duplicate_seller_is_rejected(client, duplicate):
+    assert client.post("/api/v1/seller", json=SELLER).status_code == 201
+
+    response = client.post("/api/v1/seller", json=duplicate)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Username or email already registered"}